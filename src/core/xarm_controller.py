@@ -1,11 +1,12 @@
 import yaml
 import time
+from dataclasses import dataclass
 from enum import Enum
 from collections import deque
-from xarm.wrapper import XArmAPI
 import os
 from typing import Dict, List, Optional, Tuple, Any, Callable
 import threading
+from contextlib import contextmanager
 
 from core.xarm_utils import (
     SafetyLevel, load_config, get_default_config, validate_target_position,
@@ -17,6 +18,19 @@ from core.xarm_utils import (
     get_joint_limits_for_model, check_operation_result, validate_and_apply_safety_config
 )
 
+# The xArm SDK is only needed for hardware connections and is slow to import,
+# so it is loaded on first use (see _get_xarm_api).
+XArmAPI = None
+
+
+def _get_xarm_api():
+    """Import and return the SDK's XArmAPI class on first use."""
+    global XArmAPI
+    if XArmAPI is None:
+        from xarm.wrapper import XArmAPI as _XArmAPI
+        XArmAPI = _XArmAPI
+    return XArmAPI
+
 class ComponentState(Enum):
     """Enum for component states"""
     UNKNOWN = "unknown"
@@ -26,6 +40,13 @@ class ComponentState(Enum):
     ERROR = "error"
     MAINTENANCE = "maintenance"  # State for maintenance mode
 
+@dataclass(frozen=True)
+class Capabilities:
+    """Snapshot of controller capabilities taken once after initialization"""
+    track_enabled: bool
+    has_gripper: bool
+    positions: frozenset
+
 class XArmController:
     """
     xArm controller with intelligent error recovery, improved safety validation,
@@ -110,7 +131,7 @@ class XArmController:
                 print("Docker profile detected, disabling SDK joint limit checks to prevent serial number bug.")
 
             # Use official SDK with do_not_open parameter
-            self.arm = XArmAPI(
+            self.arm = _get_xarm_api()(
                 self.host,
                 do_not_open=True,
                 check_joint_limit=not disable_sdk_joint_check
@@ -204,6 +225,9 @@ class XArmController:
 
         # Motion state tracking
         self._motion_in_progress = False
+        self._batch_active = False
+        self._motion_pending = False  # A wait=False move was sent and not yet confirmed idle
+        self._state_event = threading.Event()  # Set by the SDK state-changed callback
 
         # State tracking
         self.alive = True
@@ -1067,6 +1091,7 @@ class XArmController:
 
     def _state_changed_callback(self, data):
         """Callback for state changes."""
+        self._state_event.set()
         if not self._ignore_exit_state and data and data['state'] == 4:
             self.alive = False
             self.states['arm'] = ComponentState.ERROR
@@ -1193,6 +1218,10 @@ class XArmController:
         """Check if a specific component is enabled."""
         return self.states.get(component, ComponentState.UNKNOWN) == ComponentState.ENABLED
 
+    def has_error(self):
+        """Check if the arm has stopped or reported an error."""
+        return self.states['arm'] == ComponentState.ERROR or not self.is_alive
+
     def get_error_history(self, count=10):
         """Get recent error history."""
         return list(self.error_history)[-count:] if self.error_history else []
@@ -1256,7 +1285,8 @@ class XArmController:
     # =============================================================================
 
     def move_to_position(self, x, y, z, roll=None, pitch=None, yaw=None,
-                        speed=None, check_collision=True, motion_type=0, wait=True):
+                        speed=None, check_collision=True, motion_type=0, wait=True,
+                        blend_radius=None):
         """
         Move to a Cartesian position with collision checking and intelligent planning.
 
@@ -1267,6 +1297,8 @@ class XArmController:
             check_collision: Enable collision detection and validation
             motion_type: Motion planning type (0=default, 1=alternative)
             wait: Wait for movement completion
+            blend_radius: Blend into the next queued move within this radius in mm
+                (None stops at the target)
 
         Returns:
             bool: True if movement successful, False otherwise
@@ -1293,6 +1325,9 @@ class XArmController:
 
         # Collision checking
         if check_collision and not self.simulation_mode:
+            # The check-only mode applies to the whole controller, so drain the queue first
+            if not self._flush_batch():
+                return False
             # Use SDK's built-in collision checking
             self.arm.set_only_check_type(1)  # Check without moving
             check_code = self.arm.set_position(x, y, z, roll, pitch, yaw, speed=speed)
@@ -1306,11 +1341,15 @@ class XArmController:
                 if motion_type == 0:
                     print("Trying alternative motion planning (motion_type=1)")
                     return self.move_to_position(x, y, z, roll, pitch, yaw,
-                                                speed, check_collision, motion_type=1, wait=wait)
+                                                speed, check_collision, motion_type=1, wait=wait,
+                                                blend_radius=blend_radius)
                 else:
                     print("Alternative motion planning also failed")
                     return False
 
+        # Queue without blocking while a batch is open
+        wait = wait and not self._batch_active
+
         # Execute the movement with performance tracking
         self._motion_in_progress = True
         start_time = time.time()
@@ -1323,9 +1362,11 @@ class XArmController:
                 self.last_position = target_pos
                 success = True
             else:
-                code = self.arm.set_position(x, y, z, roll, pitch, yaw,
+                code = self.arm.set_position(x, y, z, roll, pitch, yaw, radius=blend_radius,
                                            speed=speed, wait=wait, motion_type=motion_type)
                 success = self.check_code(code, f'move_to_position({x}, {y}, {z})')
+                if success and not wait:
+                    self._motion_pending = True
 
             # Track performance metrics
             cycle_time = time.time() - start_time
@@ -1337,7 +1378,7 @@ class XArmController:
             if success:
                 self._update_positions()
                 # Calculate and track accuracy error
-                if not self.simulation_mode:
+                if not self.simulation_mode and wait:
                     actual_pos = self.get_current_position()
                     if actual_pos:
                         accuracy_error = ((actual_pos[0] - x)**2 + (actual_pos[1] - y)**2 + (actual_pos[2] - z)**2)**0.5
@@ -1348,10 +1389,14 @@ class XArmController:
         finally:
             self._motion_in_progress = False
 
-    def move_to_named_location(self, location_name, speed=None):
+    def move_to_named_location(self, location_name, speed=None, wait=True, blend_radius=None):
         """
         Move to a predefined location from the position config.
         Supports both joint-based and Cartesian-based location definitions.
+
+        A blend_radius (mm) lets the arm round the corner into the next queued
+        move instead of stopping; it only has an effect with wait=False or
+        inside a batch.
         """
         # Check if positions are defined in config
         if 'positions' not in self.position_config:
@@ -1373,14 +1418,15 @@ class XArmController:
                 angles.append(0.0)  # Pad with zeros for missing joints
 
             print(f"Moving to location '{location_name}' using joint angles: {angles[:self.num_joints]}")
-            return self.move_joints(angles=angles[:self.num_joints], speed=speed)
+            return self.move_joints(angles=angles[:self.num_joints], speed=speed, wait=wait,
+                                    blend_radius=blend_radius)
         elif isinstance(location, dict):
             # Cartesian-based location (e.g., {x: 300, y: 0, z: 300, ...})
             print(f"Moving to location '{location_name}' using Cartesian coordinates")
             return self.move_to_position(
                 x=location['x'], y=location['y'], z=location['z'],
                 roll=location.get('roll'), pitch=location.get('pitch'), yaw=location.get('yaw'),
-                speed=speed
+                speed=speed, wait=wait, blend_radius=blend_radius
             )
         else:
             print(f"Error: Invalid location format for '{location_name}'. Expected list (joint angles) or dict (Cartesian coordinates)")
@@ -1397,6 +1443,10 @@ class XArmController:
         if speed is None:
             speed = self.tcp_speed
 
+        # Offsets are relative to where queued moves end, so let them finish
+        if not self._flush_batch():
+            return False
+
         code = self.arm.set_position(x=dx, y=dy, z=dz, roll=droll, pitch=dpitch, yaw=dyaw,
                                    speed=speed, relative=True, wait=True)
         success = self.check_code(code, f'move_relative({dx}, {dy}, {dz})')
@@ -1409,7 +1459,7 @@ class XArmController:
     # =============================================================================
 
     def move_joints(self, angles, speed=None, acceleration=None,
-                   wait=True, check_collision=True):
+                   wait=True, check_collision=True, blend_radius=None):
         """
         Move individual joints to specified angles with comprehensive safety checking.
 
@@ -1419,6 +1469,8 @@ class XArmController:
             acceleration (float, optional): Joint acceleration (degrees/second²)
             wait (bool): Wait for movement completion
             check_collision (bool): Enable collision detection and validation
+            blend_radius (float, optional): Blend into the next queued move within
+                this radius in mm (None stops at the target)
 
         Returns:
             bool: True if movement successful, False otherwise
@@ -1439,6 +1491,9 @@ class XArmController:
             if self._check_joint_collision(angles):
                 return False
 
+        # Queue without blocking while a batch is open
+        wait = wait and not self._batch_active
+
         # Execute movement with performance tracking
         self._motion_in_progress = True
         start_time = time.time()
@@ -1450,8 +1505,11 @@ class XArmController:
                 success = True
             else:
                 # Workaround for Docker simulator serial number bug - disable range checking
-                code = self.arm.set_servo_angle(angle=angles, speed=speed, mvacc=acceleration, wait=wait, check=False)
+                code = self.arm.set_servo_angle(angle=angles, speed=speed, mvacc=acceleration, wait=wait,
+                                                radius=blend_radius, check=False)
                 success = self.check_code(code, f'move_joints({angles})')
+                if success and not wait:
+                    self._motion_pending = True
 
             # Track performance metrics
             cycle_time = time.time() - start_time
@@ -1476,7 +1534,9 @@ class XArmController:
             print("Arm is not enabled")
             return False
 
-        # Get current joint angles
+        # Get current joint angles once queued moves have finished
+        if not self._flush_batch():
+            return False
         ret = self.arm.get_servo_angle()
         if ret[0] != 0:
             print("Failed to get current joint angles")
@@ -1524,6 +1584,130 @@ class XArmController:
         code = self.arm.emergency_stop()
         return self.check_code(code, 'emergency_stop')
 
+    # =============================================================================
+    # BATCHED MOTION
+    # =============================================================================
+
+    def begin_batch(self):
+        """
+        Start queuing arm motions instead of waiting for each one to complete.
+
+        While a batch is open, joint and Cartesian moves are sent with wait=False so
+        the controller's motion queue is fed back-to-back. Gripper and track commands
+        are not part of the arm's motion queue, so they flush the batch first.
+        """
+        self._batch_active = True
+
+    def end_batch(self, timeout=None):
+        """
+        Close the current batch and wait once for all queued motions to finish.
+
+        Args:
+            timeout (float, optional): Maximum time to wait in seconds
+
+        Returns:
+            bool: True if all queued motions completed, False otherwise
+        """
+        self._batch_active = False
+        return self.wait_until_idle(timeout=timeout)
+
+    @contextmanager
+    def batched(self, timeout=None):
+        """
+        Context manager wrapping begin_batch()/end_batch().
+
+        If the block raises, the batch is closed without waiting so the caller
+        can stop the robot immediately.
+
+        Raises:
+            RuntimeError: If the queued motions did not complete successfully
+        """
+        self.begin_batch()
+        try:
+            yield self
+        except BaseException:
+            self._batch_active = False
+            raise
+        if not self.end_batch(timeout=timeout):
+            raise RuntimeError("Batched motion did not complete successfully")
+
+    def _flush_batch(self):
+        """Wait for queued arm motions before issuing a command outside the motion queue."""
+        if not self._batch_active or not self._motion_pending:
+            return True
+        return self.wait_until_idle()
+
+    def wait_until_idle(self, timeout=None, settle_ms=50, poll_interval=0.05,
+                        unseen_motion_ms=500):
+        """
+        Block until the arm has finished all queued motions.
+
+        The state is queried from the controller with get_state() on every check,
+        because the cached arm.state only changes when a report packet arrives
+        and can still show "idle" right after a move is queued. Following the
+        SDK's own wait_move(), the arm must stay idle for settle_ms once motion
+        has been seen. If a wait=False move was sent and no motion has been
+        observed yet, it must stay idle for unseen_motion_ms instead; after
+        blocking moves only settle_ms applies. The SDK state-changed callback
+        wakes the loop early between checks.
+
+        Args:
+            timeout (float, optional): Maximum time to wait in seconds. None waits indefinitely.
+            settle_ms (int): Time in milliseconds the arm must remain idle after moving
+            poll_interval (float): Maximum delay between state checks in seconds
+            unseen_motion_ms (int): Time in milliseconds the arm must remain idle
+                if a non-blocking move is pending and was never seen moving
+
+        Returns:
+            bool: True once the arm is idle, False on timeout, stop or error
+        """
+        if self.simulation_mode:
+            return self.is_alive
+
+        if not self.arm:
+            return False
+
+        deadline = None if timeout is None else time.time() + timeout
+        # Only a non-blocking move can still be about to start
+        seen_motion = not self._motion_pending
+        idle_since = None
+        while deadline is None or time.time() < deadline:
+            if not self.is_alive:
+                print("Arm stopped or reported an error while waiting for motion")
+                return False
+
+            self._state_event.clear()
+            code, state = self.arm.get_state()
+            if code != 0:
+                print(f"Failed to query arm state while waiting for motion: code={code}")
+                return False
+
+            if state >= 4:
+                print(f"Arm stopped while waiting for motion: state={state}")
+                return False
+
+            # States 0/1 mean motion is pending or running, 3 means paused
+            if state in (0, 1, 3):
+                seen_motion = True
+                idle_since = None
+                wait_time = poll_interval
+            else:
+                now = time.time()
+                if idle_since is None:
+                    idle_since = now
+                required = (settle_ms if seen_motion else max(settle_ms, unseen_motion_ms)) / 1000.0
+                remaining = required - (now - idle_since)
+                if remaining <= 0:
+                    self._motion_pending = False
+                    return True
+                wait_time = min(poll_interval, remaining)
+
+            # Wake early on a state change instead of sleeping the full interval
+            self._state_event.wait(wait_time)
+
+        print("Timed out waiting for arm motion to complete")
+        return False
+
     # =============================================================================
     # GRIPPER CONTROL - Multiple Types Supported
     # =============================================================================
@@ -1539,6 +1723,9 @@ class XArmController:
             print("Gripper is not enabled")
             return False
 
+        if not self._flush_batch():
+            return False
+
         if self.simulation_mode:
             print(f"[SIM] {self.gripper_type.title()} gripper opened")
             return True
@@ -1563,6 +1750,9 @@ class XArmController:
             print("Gripper is not enabled")
             return False
 
+        if not self._flush_batch():
+            return False
+
         if self.simulation_mode:
             print(f"[SIM] {self.gripper_type.title()} gripper closed")
             return True
@@ -1625,6 +1815,9 @@ class XArmController:
         if not self._validate_track_speed(speed):
             return False
 
+        if not self._flush_batch():
+            return False
+
         # Performance tracking
         self._motion_in_progress = True
         start_time = time.time()
@@ -1806,6 +1999,20 @@ class XArmController:
             return list(self.position_config['positions'].keys())
         return []
 
+    def snapshot_capabilities(self):
+        """
+        Capture component availability and named positions in one call.
+
+        Returns:
+            Capabilities: Frozen snapshot that callers can check instead of
+                querying the controller repeatedly
+        """
+        return Capabilities(
+            track_enabled=self.is_component_enabled('track'),
+            has_gripper=self.has_gripper(),
+            positions=frozenset(self.get_named_locations())
+        )
+
     def get_system_info(self):
         """Get information about the configured system."""
         info = {
@@ -14,108 +14,282 @@ Optional flags:
     --slow              # Use 0.5x speed multiplier  
     --fast              # Use 2.0x speed multiplier
     --speed-multiplier  # Custom speed multiplier (e.g., --speed-multiplier 1.5)
+    --serve             # Keep the controller initialized and accept --client runs
+    --client            # Run the demo on a --serve instance
+    --socket PATH       # Unix socket used by --serve/--client
 """
 
 import argparse
+import contextlib
+import functools
+import json
+import math
+import os
+import select
+import signal
+import socket
+import socketserver
+import stat
 import sys
-import time
-from core.xarm_controller import XArmController
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Optional
 
 
-def move_with_confirmation(controller, movement_func, description, auto_confirm=False, speed_info=None):
+def render_step(description, speed_info=None):
     """
-    Execute a movement with optional user confirmation.
+    Build the text shown before a movement step.
     
     Args:
-        controller: XArmController instance
-        movement_func: Function that performs the movement
         description: Description of the movement for user
-        auto_confirm: If True, skip user confirmation
         speed_info: Dictionary with speed information to display
     
     Returns:
-        bool: True if movement successful, False otherwise
+        str: Multi-line step header
     """
-    print(f"\n{description}")
+    lines = [f"\n{description}"]
     
     if speed_info:
         if 'joint_speed' in speed_info:
-            print(f"   Joint speed: {speed_info['joint_speed']}°/s")
+            lines.append(f"   Joint speed: {speed_info['joint_speed']}°/s")
         if 'tcp_speed' in speed_info:
-            print(f"   TCP speed: {speed_info['tcp_speed']} mm/s")
+            lines.append(f"   TCP speed: {speed_info['tcp_speed']} mm/s")
         if 'track_speed' in speed_info:
-            print(f"   Track speed: {speed_info['track_speed']} mm/s")
+            lines.append(f"   Track speed: {speed_info['track_speed']} mm/s")
     
-    if not auto_confirm:
-        try:
-            input("Press Enter to continue (Ctrl+C to abort)...")
-        except KeyboardInterrupt:
-            print("\nMovement aborted by user")
-            controller.stop_motion()  # Stop robot immediately
-            return False
+    return "\n".join(lines)
+
+
+def _install_stop_handler(controller):
+    """
+    Stop the robot on Ctrl+C from a single SIGINT handler.
     
-    print("Executing movement...")
-    try:
-        success = movement_func()
-        
-        if success:
-            print("Movement completed successfully")
-            time.sleep(1)  # Brief pause between movements
+    The first Ctrl+C stops the robot and exits with status 130. Further
+    presses are ignored from then on, so they cannot interrupt the stop or
+    the controller disconnect during cleanup.
+    
+    Args:
+        controller: XArmController instance to stop
+    """
+    def handle_sigint(signum, frame):
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        print("\nInterrupted by user - stopping robot immediately!")
+        controller.stop_motion()
+        sys.exit(130)
+    
+    signal.signal(signal.SIGINT, handle_sigint)
+
+
+def _wait_for_enter_or_fault(controller, prompt, poll_interval=0.1):
+    """
+    Wait for the user to press Enter while watching the controller for faults.
+    
+    Unlike input(), this keeps polling the controller, so a fault raised while
+    the prompt is shown (e.g. emergency stop) aborts the demo instead of letting
+    the next step run.
+    
+    Args:
+        controller: XArmController instance
+        prompt: Text shown to the user
+        poll_interval: Seconds between controller checks
+    
+    Returns:
+        bool: True if Enter was pressed, False on a controller fault or closed stdin
+    """
+    if os.name == 'nt':
+        # select() only supports sockets on Windows
+        input(prompt)
+        return True
+    
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    while True:
+        ready, _, _ = select.select([sys.stdin], [], [], poll_interval)
+        if ready:
+            if not sys.stdin.readline():
+                print("\nInput closed, aborting")
+                return False
             return True
-        else:
-            print("Movement failed")
+        if controller.has_error():
+            print("\nController fault detected - stopping robot")
+            controller.stop_motion()
             return False
-    except KeyboardInterrupt:
-        print("\nMovement interrupted - stopping robot immediately!")
-        controller.stop_motion()  # Stop robot immediately
+
+
+def move_with_confirmation(controller, executor, movement_func, step_text, auto_confirm=False):
+    """
+    Confirm a movement with the user and start it on the executor thread.
+    
+    Args:
+        controller: XArmController instance
+        executor: Single-worker executor that runs the movement
+        movement_func: Function that performs the movement
+        step_text: Pre-rendered step header (see render_step)
+        auto_confirm: If True, skip user confirmation
+    
+    Returns:
+        Future: The running movement, or None if aborted by the user
+    """
+    print(step_text)
+    
+    if not auto_confirm:
+        if not _wait_for_enter_or_fault(controller, "Press Enter to continue (Ctrl+C to abort)..."):
+            return None
+    
+    print("Executing movement...")
+    return executor.submit(movement_func)
+
+
+def finish_movement(controller, future, queued=False):
+    """
+    Wait for a movement started by move_with_confirmation to complete.
+    
+    Args:
+        controller: XArmController instance
+        future: Future returned by move_with_confirmation
+        queued: True if the step only queued an arm move (wait=False inside a
+            batch), so a successful result does not mean it has finished yet
+    
+    Returns:
+        bool: True if movement successful, False otherwise
+    """
+    success = future.result()
+    
+    if not success:
+        print("Movement failed")
         return False
+    
+    if queued:
+        # The move was only accepted; a batch confirms completion later
+        print("Movement queued")
+        return True
+    
+    if controller.wait_until_idle(settle_ms=50):
+        print("Movement completed successfully")
+        return True
+    else:
+        print("Movement failed")
+        return False
+
 
+# Default Unix socket for --serve/--client
+DEFAULT_SOCKET_PATH = '/tmp/xarm_plate_pickup.sock'
+
+# Blend radius used between the lift (step 6) and the final home move (step 7)
+_LIFT_BLEND_RADIUS = 20  # mm
+
+# Banner line templates for each kind of step in the speed configuration
+_FMT_JOINT = "   {step}: {joint_speed}°/s (joint)"
+_FMT_TRACK = "   {step}: {track_speed} mm/s (track)"
+_FMT_OTHER = "   {step}: {description}"
+
+# Named positions that must exist in position_config.yaml
+_REQUIRED_POSITIONS = ('robot_home', 'deck_high', 'deck_low')
+
+# Upper speed bounds accepted by the demo
+_MAX_JOINT_SPEED = 180  # °/s
+_MAX_TRACK_SPEED = 500  # mm/s
+
+# Speed configurations for each step of the plate pickup demo.
+# These speeds are optimized for safe plate handling operations.
+_SPEED_CONFIG = {
+    'robot_home': {
+        'joint_speed': 20,   # °/s - Standard joint speed for homing
+        'description': 'Robot joint homing speed with gripper open'
+    },
+    'move_to_local_1': {
+        'track_speed': 150,  # mm/s - Moderate track speed to Local_1
+        'description': 'Linear track movement to Local_1 position'
+    },
+    'deck_high': {
+        'joint_speed': 15,   # °/s - Careful approach to deck area
+        'description': 'Joint movement to deck high position'
+    },
+    'deck_low': {
+        'joint_speed': 8,    # °/s - Very slow approach to plate level
+        'description': 'Slow descent to plate pickup level'
+    },
+    'plate_pickup': {
+        'description': 'Close gripper to pick up well plate'
+    },
+    'deck_high_return': {
+        'joint_speed': 10,   # °/s - Careful lift with plate
+        'description': 'Slow lift to safe height with plate'
+    },
+    'final_home': {
+        'joint_speed': 15,   # °/s - Safe return to home with plate
+        'description': 'Return to home position with plate'
+    }
+}
 
+
+def _speed_format(config):
+    """Pick the banner line template for a step's speed configuration."""
+    if 'joint_speed' in config:
+        return _FMT_JOINT
+    if 'track_speed' in config:
+        return _FMT_TRACK
+    return _FMT_OTHER
+
+
+@functools.lru_cache(maxsize=1)
 def get_speed_config():
     """
-    Define speed configurations for each step of the plate pickup demo.
-    These speeds are optimized for safe plate handling operations.
+    Get the speed configurations for each step of the plate pickup demo.
+    
+    The result is cached and read-only; build a new dict to override speeds.
     
     Returns:
-        dict: Speed configurations for each movement step
+        Mapping: Speed configurations for each movement step
     """
-    return {
-        'robot_home': {
-            'joint_speed': 20,   # °/s - Standard joint speed for homing
-            'description': 'Robot joint homing speed with gripper open'
-        },
-        'move_to_local_1': {
-            'track_speed': 150,  # mm/s - Moderate track speed to Local_1
-            'description': 'Linear track movement to Local_1 position'
-        },
-        'deck_high': {
-            'joint_speed': 15,   # °/s - Careful approach to deck area
-            'description': 'Joint movement to deck high position'
-        },
-        'deck_low': {
-            'joint_speed': 8,    # °/s - Very slow approach to plate level
-            'description': 'Slow descent to plate pickup level'
-        },
-        'plate_pickup': {
-            'description': 'Close gripper to pick up well plate'
-        },
-        'deck_high_return': {
-            'joint_speed': 10,   # °/s - Careful lift with plate
-            'description': 'Slow lift to safe height with plate'
-        },
-        'final_home': {
-            'joint_speed': 15,   # °/s - Safe return to home with plate
-            'description': 'Return to home position with plate'
-        }
-    }
+    return MappingProxyType({
+        step: MappingProxyType(config) for step, config in _SPEED_CONFIG.items()
+    })
+
+
+def _preflight(caps, speeds) -> Optional[str]:
+    """
+    Check positions, components and speeds before any motion.
+    
+    Args:
+        caps: Capabilities snapshot from controller.snapshot_capabilities()
+        speeds: Speed configuration for each step
+    
+    Returns:
+        str: Error message if the demo cannot run, None otherwise
+    """
+    for pos_name in _REQUIRED_POSITIONS:
+        if pos_name not in caps.positions:
+            return f"Position '{pos_name}' not found in position_config.yaml"
+    
+    # The track configuration itself is validated by the movement function
+    if not caps.track_enabled:
+        return "Linear track is not enabled"
+    
+    if not caps.has_gripper:
+        return "No gripper configured"
+    
+    for step, config in speeds.items():
+        if not 0 < config.get('joint_speed', 1) <= _MAX_JOINT_SPEED:
+            return f"Joint speed for '{step}' must be between 0 and {_MAX_JOINT_SPEED}°/s"
+        if not 0 < config.get('track_speed', 1) <= _MAX_TRACK_SPEED:
+            return f"Track speed for '{step}' must be between 0 and {_MAX_TRACK_SPEED} mm/s"
+    
+    return None
+
+
+def _merged_speeds(custom_speeds=None):
+    """Overlay optional per-step speed overrides on the default speed configuration."""
+    return {**get_speed_config(), **(custom_speeds or {})}
 
 
-def demo_plate_pickup(controller, auto_confirm=False, custom_speeds=None):
+def demo_plate_pickup(controller, caps, auto_confirm=False, custom_speeds=None):
     """
     Execute the complete plate pickup sequence.
     
     Args:
         controller: XArmController instance
+        caps: Capabilities snapshot from controller.snapshot_capabilities()
         auto_confirm: If True, skip user confirmations between movements
         custom_speeds: Optional dictionary to override default speeds
     
@@ -124,212 +298,359 @@ def demo_plate_pickup(controller, auto_confirm=False, custom_speeds=None):
     """
     try:
         # Get speed configurations
-        speeds = get_speed_config()
-        if custom_speeds:
-            speeds.update(custom_speeds)
-    
-        print("\n" + "=" * 60)
-        print("PLATE PICKUP DEMO")
-        print("=" * 60)
-        print("This demo will execute the following sequence:")
-        print("1. Robot joints → Home position + Open gripper")
-        print("2. Linear track → Local_1 position")
-        print("3. Joint movement → deck_high position") 
-        print("4. Joint movement → deck_low position")
-        print("5. Close gripper (grip well plate)")
-        print("6. Joint movement → deck_high position (with plate)")
-        print("7. Robot joints → Home position (with plate)")
-        print("\nSpeed Configuration:")
-        for step, config in speeds.items():
-            if 'joint_speed' in config:
-                print(f"   {step}: {config['joint_speed']}°/s (joint)")
-            elif 'track_speed' in config:
-                print(f"   {step}: {config['track_speed']} mm/s (track)")
-            else:
-                print(f"   {step}: {config['description']}")
-        print("=" * 60)
+        speeds = _merged_speeds(custom_speeds)
         
-        if not auto_confirm:
-            try:
-                input("Press Enter to start the demo (Ctrl+C to abort)...")
-            except KeyboardInterrupt:
-                print("\nDemo aborted by user")
-                controller.stop_motion()
-                return False
+        # Validate everything up front so nothing is prompted or moved on failure
+        error = _preflight(caps, speeds)
+        if error:
+            print(f"Error: {error}")
+            return False
     
-        # Get predefined positions
-        positions = controller.position_config.get('positions', {})
-        
-        # Check that all required positions exist
-        required_positions = [
-            'robot_home', 'deck_high', 'deck_low'
-        ]
+        # Build the banner once and emit it in a single write
+        banner = "\n".join([
+            "",
+            "=" * 60,
+            "PLATE PICKUP DEMO",
+            "=" * 60,
+            "This demo will execute the following sequence:",
+            "1. Robot joints → Home position + Open gripper",
+            "2. Linear track → Local_1 position",
+            "3. Joint movement → deck_high position",
+            "4. Joint movement → deck_low position",
+            "5. Close gripper (grip well plate)",
+            "6. Joint movement → deck_high position (with plate)",
+            "7. Robot joints → Home position (with plate)",
+            "",
+            "Speed Configuration:",
+            *[_speed_format(config).format(step=step, **config) for step, config in speeds.items()],
+            "=" * 60,
+        ])
+        sys.stdout.write(banner + "\n")
+        sys.stdout.flush()
         
-        for pos_name in required_positions:
-            if pos_name not in positions:
-                print(f"Error: Position '{pos_name}' not found in position_config.yaml")
+        if not auto_confirm:
+            if not _wait_for_enter_or_fault(controller, "Press Enter to start the demo (Ctrl+C to abort)..."):
                 return False
-        
-        # Check if linear track is enabled (the configuration will be validated by the movement function)
-        if not controller.is_component_enabled('track'):
-            print("Error: Linear track is not enabled")
-            return False
     
-        # Step 1: Robot joints to home + open gripper
-        joint_speed = speeds['robot_home']['joint_speed']
-        def move_home_and_open_gripper():
-            success = controller.move_to_named_location('robot_home', speed=joint_speed)
-            if success:
-                controller.open_gripper()  # Open gripper when going home
-            return success
-        if not move_with_confirmation(
-            controller,
-            move_home_and_open_gripper,
-            "Step 1: Moving robot joints to home position + opening gripper",
-            auto_confirm,
-            speeds['robot_home']
-        ):
-            return False
-        
-        # Step 2: Linear track to Local_1
+        # Resolve every step speed once so the steps below are plain SDK calls
+        home_js, tohigh_js, tolow_js, lift_js, return_js = (
+            speeds[k]['joint_speed']
+            for k in ('robot_home', 'deck_high', 'deck_low', 'deck_high_return', 'final_home')
+        )
         track_speed = speeds['move_to_local_1']['track_speed']
-        if not move_with_confirmation(
-            controller,
-            lambda: controller.move_track_to_named_location('Local_1', speed=track_speed),
-            "Step 2: Moving linear track to Local_1 position",
-            auto_confirm,
-            speeds['move_to_local_1']
-        ):
-            return False
-        
-        # Step 3: Joint movement to deck_high
-        joint_speed = speeds['deck_high']['joint_speed']
-        if not move_with_confirmation(
-            controller,
-            lambda: controller.move_to_named_location('deck_high', speed=joint_speed),
-            "Step 3: Joint movement to deck_high position",
-            auto_confirm,
-            speeds['deck_high']
-        ):
-            return False
+        lift_blend = _LIFT_BLEND_RADIUS if auto_confirm else None
         
-        # Step 4: Joint movement to deck_low (approach plate)
-        joint_speed = speeds['deck_low']['joint_speed']
-        if not move_with_confirmation(
-            controller,
-            lambda: controller.move_to_named_location('deck_low', speed=joint_speed),
-            "Step 4: Joint movement to deck_low position (approach plate)",
-            auto_confirm,
-            speeds['deck_low']
-        ):
-            return False
-        
-        # Step 5: Close gripper to pick up plate
-        if not move_with_confirmation(
-            controller,
-            lambda: controller.close_gripper(),
-            "Step 5: Closing gripper to pick up well plate",
-            auto_confirm,
-            speeds['plate_pickup']
-        ):
-            return False
-        
-        # Step 6: Joint movement back to deck_high (with plate)
-        joint_speed = speeds['deck_high_return']['joint_speed']
-        if not move_with_confirmation(
-            controller,
-            lambda: controller.move_to_named_location('deck_high', speed=joint_speed),
-            "Step 6: Joint movement to deck_high position (with plate)",
-            auto_confirm,
-            speeds['deck_high_return']
-        ):
-            return False
+        # Step 1: Robot joints to home + open gripper
+        def move_home_and_open_gripper():
+            # The gripper has its own actuator, so start opening it without
+            # waiting and let it finish while the joints move home. The step
+            # fails if the open command was rejected, so the arm never lowers
+            # onto the plate (step 4) with an unopened gripper.
+            opened = controller.open_gripper(wait=False)
+            if not opened:
+                print("Failed to open gripper")
+            moved = controller.move_to_named_location('robot_home', speed=home_js)
+            return opened and moved
         
-        # Step 7: Robot joints to home (with plate)
-        joint_speed = speeds['final_home']['joint_speed']
-        if not move_with_confirmation(
-            controller,
-            lambda: controller.move_to_named_location('robot_home', speed=joint_speed),
-            "Step 7: Joint movement back to robot home position (with plate)",
-            auto_confirm,
-            speeds['final_home']
-        ):
-            return False
+        # Each step: (movement, description, speed key, whether it is an arm
+        # move that a batch queues instead of waiting for)
+        steps = [
+            (move_home_and_open_gripper,
+             "Step 1: Moving robot joints to home position + opening gripper",
+             'robot_home', True),
+            # Step 2: Linear track to Local_1
+            (lambda: controller.move_track_to_named_location('Local_1', speed=track_speed),
+             "Step 2: Moving linear track to Local_1 position",
+             'move_to_local_1', False),
+            # Step 3: Joint movement to deck_high
+            (lambda: controller.move_to_named_location('deck_high', speed=tohigh_js),
+             "Step 3: Joint movement to deck_high position",
+             'deck_high', True),
+            # Step 4: Joint movement to deck_low (approach plate)
+            (lambda: controller.move_to_named_location('deck_low', speed=tolow_js),
+             "Step 4: Joint movement to deck_low position (approach plate)",
+             'deck_low', True),
+            # Step 5: Close gripper to pick up plate
+            (lambda: controller.close_gripper(),
+             "Step 5: Closing gripper to pick up well plate",
+             'plate_pickup', False),
+            # Step 6: Joint movement back to deck_high (with plate). In auto mode
+            # step 7 is queued right behind it, so blend through deck_high
+            # instead of stopping there.
+            (lambda: controller.move_to_named_location('deck_high', speed=lift_js, blend_radius=lift_blend),
+             "Step 6: Joint movement to deck_high position (with plate)",
+             'deck_high_return', True),
+            # Step 7: Robot joints to home (with plate)
+            (lambda: controller.move_to_named_location('robot_home', speed=return_js),
+             "Step 7: Joint movement back to robot home position (with plate)",
+             'final_home', True),
+        ]
         
-        print("\nPlate Pickup Demo completed successfully!")
-        print("Well plate has been successfully picked up and moved to home position!")
-        print("=" * 60)
+        # Movements run on a worker thread so the next step header is prepared
+        # while the arm is still moving. In auto mode, arm motions are also
+        # queued back-to-back and the batch waits once at the end (raising if
+        # the motions did not complete); gripper and track commands flush the
+        # queue so the sequence order is kept.
+        batch = controller.batched() if auto_confirm else contextlib.nullcontext()
+        with batch, ThreadPoolExecutor(max_workers=1) as executor:
+            pending = None
+            pending_queued = False
+            for movement_func, description, speed_key, arm_move in steps:
+                step_text = render_step(description, speeds[speed_key])
+                if pending is not None and not finish_movement(controller, pending, pending_queued):
+                    return False
+                pending = move_with_confirmation(
+                    controller, executor, movement_func, step_text, auto_confirm)
+                if pending is None:
+                    return False
+                pending_queued = auto_confirm and arm_move
+            if not finish_movement(controller, pending, pending_queued):
+                return False
+
+        sys.stdout.write("\n".join([
+            "",
+            "Plate Pickup Demo completed successfully!",
+            "Well plate has been successfully picked up and moved to home position!",
+            "=" * 60,
+        ]) + "\n")
+        sys.stdout.flush()
         return True
     
-    except KeyboardInterrupt:
-        print("\nDemo sequence interrupted by user")
-        controller.stop_motion()
-        return False
     except Exception as e:
         print(f"\nDemo sequence failed with error: {e}")
         controller.stop_motion()
         return False
 
 
+def _positive_float(value):
+    """argparse type for a finite float that must be greater than zero."""
+    number = float(value)
+    if not math.isfinite(number) or number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a finite positive number, got {value}")
+    return number
+
+
+def scale_speeds(speed_multiplier):
+    """
+    Scale the default joint and track speeds by a multiplier.
+    
+    Args:
+        speed_multiplier: Factor applied to every joint_speed and track_speed
+    
+    Returns:
+        dict: Scaled speed configurations, or None for a multiplier of 1.0
+    
+    Raises:
+        ValueError: If the multiplier is not finite and positive
+    """
+    if not math.isfinite(speed_multiplier) or speed_multiplier <= 0:
+        raise ValueError(f"Speed multiplier must be finite and positive, got {speed_multiplier}")
+    
+    if speed_multiplier == 1.0:
+        return None
+    
+    # Scaled speeds are rounded to whole numbers for the SDK; a result of 0 is
+    # rejected by _preflight
+    return {
+        step: {
+            key: round(value * speed_multiplier) if key in ('joint_speed', 'track_speed') else value
+            for key, value in config.items()
+        }
+        for step, config in get_speed_config().items()
+    }
+
+
+# Longest request line the server reads; real requests are a few dozen bytes
+_MAX_REQUEST_BYTES = 4096
+
+
+class _DemoRequestHandler(socketserver.StreamRequestHandler):
+    """Handle one JSON request per connection, e.g. {"cmd": "run", "auto": true, "speed": 1.0}."""
+    
+    # Seconds a client may stall before the server moves on to the next one
+    timeout = 5
+    
+    def handle(self):
+        try:
+            line = self.rfile.readline(_MAX_REQUEST_BYTES + 1)
+            if len(line) > _MAX_REQUEST_BYTES:
+                raise ValueError(f"Request exceeds {_MAX_REQUEST_BYTES} bytes")
+            request = json.loads(line)
+            if request.get('cmd') != 'run':
+                reply = {'success': False, 'error': f"Unknown command '{request.get('cmd')}'"}
+            elif not request.get('auto', False):
+                # Nobody is at the server terminal to answer confirmation prompts
+                reply = {'success': False, 'error': "Server mode only supports auto-confirmed runs"}
+            else:
+                custom_speeds = scale_speeds(float(request.get('speed', 1.0)))
+                # Report setup problems to the client instead of only on the server console
+                error = _preflight(self.server.caps, _merged_speeds(custom_speeds))
+                if error:
+                    reply = {'success': False, 'error': error}
+                elif demo_plate_pickup(self.server.controller, self.server.caps, True, custom_speeds):
+                    reply = {'success': True}
+                else:
+                    reply = {'success': False, 'error': "Demo sequence failed; see server output"}
+        except Exception as e:
+            reply = {'success': False, 'error': str(e)}
+        
+        self.wfile.write((json.dumps(reply) + "\n").encode())
+
+
+def _clear_stale_socket(socket_path):
+    """
+    Make sure the server socket path is free, removing a dead socket if needed.
+    
+    Only a socket file that refuses connections (left behind by a server that
+    exited) is removed. Anything else at the path is left untouched.
+    
+    Args:
+        socket_path: Filesystem path of the Unix domain socket
+    
+    Returns:
+        str: Error message if the path cannot be used, None otherwise
+    """
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return None
+    
+    if not stat.S_ISSOCK(mode):
+        return f"{socket_path} exists and is not a socket"
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except ConnectionRefusedError:
+            os.remove(socket_path)  # Stale socket from a previous server
+            return None
+    
+    return f"Another demo server is already listening on {socket_path}"
+
+
+def serve(controller, caps, socket_path):
+    """
+    Keep an initialized controller and run the demo for each client request.
+    
+    Requests are handled one at a time over a Unix domain socket, accessible
+    only to the current user, until the server is interrupted.
+    
+    Args:
+        controller: Initialized XArmController instance
+        caps: Capabilities snapshot from controller.snapshot_capabilities()
+        socket_path: Filesystem path of the Unix domain socket; it must be free
+            (see _clear_stale_socket)
+    """
+    with socketserver.UnixStreamServer(socket_path, _DemoRequestHandler) as server:
+        try:
+            # Any local user who can connect can move the robot; the umask may allow that
+            os.chmod(socket_path, 0o600)
+            server.controller = controller
+            server.caps = caps
+            print(f"Serving plate pickup demo on {socket_path} (Ctrl+C to stop)")
+            server.serve_forever()
+        finally:
+            os.remove(socket_path)
+
+
+def run_client(socket_path, speed_multiplier):
+    """
+    Ask a running demo server to execute one auto-confirmed demo run.
+    
+    Args:
+        socket_path: Filesystem path of the server's Unix domain socket
+        speed_multiplier: Speed multiplier for this run
+    
+    Returns:
+        bool: True if the demo run was successful, False otherwise
+    """
+    request = {'cmd': 'run', 'auto': True, 'speed': speed_multiplier}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            sock.sendall((json.dumps(request) + "\n").encode())
+            reply = json.loads(sock.makefile('r').readline())
+    except (OSError, ValueError) as e:
+        print(f"Failed to reach demo server at {socket_path}: {e}")
+        return False
+    
+    if reply.get('error'):
+        print(f"Demo server error: {reply['error']}")
+    print(f"Demo {'completed successfully' if reply.get('success') else 'completed with some failures'}")
+    return bool(reply.get('success'))
+
+
 def main():
     parser = argparse.ArgumentParser(description='Plate Pickup Demo')
-    parser.add_argument('--simulate', action='store_true', help='Simulation mode')
-    parser.add_argument('--real', action='store_true', help='Real hardware mode')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--simulate', action='store_true', help='Simulation mode')
+    mode.add_argument('--real', action='store_true', help='Real hardware mode')
     parser.add_argument('--auto', action='store_true', help='Auto-confirm all movements (no user prompts)')
-    parser.add_argument('--slow', action='store_true', help='Use slow speed (0.5x multiplier)')
-    parser.add_argument('--fast', action='store_true', help='Use fast speed (2.0x multiplier)')
-    parser.add_argument('--speed-multiplier', type=float, default=1.0, help='Custom speed multiplier (default: 1.0)')
+    speed = parser.add_mutually_exclusive_group()
+    speed.add_argument('--slow', action='store_true', help='Use slow speed (0.5x multiplier)')
+    speed.add_argument('--fast', action='store_true', help='Use fast speed (2.0x multiplier)')
+    speed.add_argument('--speed-multiplier', type=_positive_float, help='Custom speed multiplier (default: 1.0)')
+    service = parser.add_mutually_exclusive_group()
+    service.add_argument('--serve', action='store_true',
+                         help='Keep the controller initialized and run the demo for each --client request')
+    service.add_argument('--client', action='store_true',
+                         help='Run the demo on a --serve instance (always auto-confirmed)')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET_PATH,
+                        help=f'Unix socket path for --serve/--client (default: {DEFAULT_SOCKET_PATH})')
     
     args = parser.parse_args()
     
-    # Determine mode
-    if args.simulate and args.real:
-        print("Cannot specify both --simulate and --real")
-        sys.exit(1)
-    
-    if not args.simulate and not args.real:
-        print("Must specify either --simulate or --real")
-        sys.exit(1)
+    # The server owns the controller, so a client does not choose the mode
+    if args.client and (args.simulate or args.real):
+        parser.error("--simulate/--real cannot be used with --client; the server chooses the mode")
+    if not args.client and not (args.simulate or args.real):
+        parser.error("one of the arguments --simulate --real is required")
     
-    simulate = args.simulate
-    auto_confirm = args.auto
+    # Each client request sets its own speed and runs auto-confirmed
+    if args.serve and (args.auto or args.slow or args.fast or args.speed_multiplier is not None):
+        parser.error("--auto/--slow/--fast/--speed-multiplier cannot be used with --serve; pass them to --client")
     
     # Process speed options
-    custom_speeds = None
     speed_description = "Default"
     
-    if args.slow and args.fast:
-        print("Cannot specify both --slow and --fast")
-        sys.exit(1)
-    
     if args.slow:
         speed_multiplier = 0.5
         speed_description = "Slow (0.5x)"
     elif args.fast:
         speed_multiplier = 2.0
         speed_description = "Fast (2.0x)"
-    elif args.speed_multiplier != 1.0:
+    elif args.speed_multiplier is not None:
         speed_multiplier = args.speed_multiplier
         speed_description = f"Custom ({speed_multiplier}x)"
     else:
         speed_multiplier = 1.0
     
+    if args.client:
+        sys.exit(0 if run_client(args.socket, speed_multiplier) else 1)
+    
+    if args.serve:
+        error = _clear_stale_socket(args.socket)
+        if error:
+            print(f"Error: {error}")
+            sys.exit(1)
+    
+    # Import after parsing so invalid arguments and --help exit without loading the SDK
+    from core.xarm_controller import XArmController
+    
+    simulate = args.simulate
+    auto_confirm = args.auto
+    
     # Apply speed multiplier if specified
-    if speed_multiplier != 1.0:
-        base_speeds = get_speed_config()
-        custom_speeds = {}
-        for step, config in base_speeds.items():
-            custom_speeds[step] = config.copy()
-            if 'joint_speed' in config:
-                custom_speeds[step]['joint_speed'] = config['joint_speed'] * speed_multiplier
-            if 'track_speed' in config:
-                custom_speeds[step]['track_speed'] = config['track_speed'] * speed_multiplier
+    custom_speeds = scale_speeds(speed_multiplier)
     
     print("Plate Pickup Demo")
     print("=" * 50)
     print(f"Mode: {'SIMULATION' if simulate else 'REAL HARDWARE'}")
-    print(f"Confirmation: {'AUTO' if auto_confirm else 'MANUAL'}")
-    print(f"Speed: {speed_description}")
+    if args.serve:
+        print(f"Server: {args.socket}")
+    else:
+        print(f"Confirmation: {'AUTO' if auto_confirm else 'MANUAL'}")
+        print(f"Speed: {speed_description}")
     print("=" * 50)
     
     try:
@@ -351,17 +672,23 @@ def main():
             return
         
         print("Controller initialized successfully")
+        _install_stop_handler(controller)
+        caps = controller.snapshot_capabilities()
         
         # Check if linear track is available
-        if not controller.is_component_enabled('track'):
+        if not caps.track_enabled:
             print("Warning: Linear track not enabled. Some movements may fail.")
         
         # Check if gripper is available
-        if not controller.has_gripper():
+        if not caps.has_gripper:
             print("Warning: No gripper configured. Plate pickup will not work.")
         
+        if args.serve:
+            serve(controller, caps, args.socket)
+            return
+        
         # Run the demo
-        success = demo_plate_pickup(controller, auto_confirm, custom_speeds)
+        success = demo_plate_pickup(controller, caps, auto_confirm, custom_speeds)
         
         if success:
             print("\nDemo completed successfully!")
@@ -369,6 +696,7 @@ def main():
             print("\nDemo completed with some failures")
             
     except KeyboardInterrupt:
+        # Only reachable before the stop handler is installed
         print("\nDemo interrupted by user")
         if 'controller' in locals() and controller:
             print("Stopping robot motion immediately...")
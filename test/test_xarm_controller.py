@@ -15,7 +15,7 @@ import os
 # Ensure src is in the python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
-from src.core.xarm_controller import XArmController, ComponentState
+from src.core.xarm_controller import XArmController, ComponentState, Capabilities
 from src.core.xarm_utils import SafetyLevel
 
 
@@ -246,6 +246,110 @@ class TestEnhancedMovementMethods:
         assert initialized_controller.stop_motion() is True
 
 
+class TestBatchedMotion:
+    """Test batched motion submission."""
+
+    def test_batched_moves_do_not_wait(self, initialized_controller):
+        """Test that moves inside a batch are queued with wait=False."""
+        initialized_controller.arm.state = 2
+        initialized_controller.arm.get_state.return_value = (0, 2)
+        with initialized_controller.batched():
+            assert initialized_controller.move_joints([0] * 6) is True
+        _, kwargs = initialized_controller.arm.set_servo_angle.call_args
+        assert kwargs['wait'] is False
+        assert initialized_controller._batch_active is False
+
+    def test_pose_read_waits_for_queued_moves(self, initialized_controller):
+        """Test that move_single_joint drains the batch before reading joint angles."""
+        arm = initialized_controller.arm
+        arm.state = 2
+        arm.get_servo_angle.side_effect = lambda: (0, [0] * 6) if arm.get_state.call_count else (1, None)
+        initialized_controller.begin_batch()
+        initialized_controller.move_joints([0] * 6)
+        states = iter([(0, 1)])
+        arm.get_state.side_effect = lambda: next(states, (0, 2))
+        assert initialized_controller.move_single_joint(0, 10) is True
+        initialized_controller.end_batch(timeout=1)
+
+    def test_blend_radius_passed_to_sdk(self, initialized_controller):
+        """Test that a blend radius is forwarded to the SDK joint move."""
+        initialized_controller.move_joints([0] * 6, wait=False, blend_radius=20)
+        _, kwargs = initialized_controller.arm.set_servo_angle.call_args
+        assert kwargs['radius'] == 20
+
+    def test_end_batch_fails_when_arm_stops(self, initialized_controller):
+        """Test that end_batch reports failure if the arm stops."""
+        initialized_controller.begin_batch()
+        initialized_controller.arm.state = 4
+        assert initialized_controller.end_batch(timeout=1) is False
+
+    def test_end_batch_waits_for_idle(self, initialized_controller):
+        """Test that end_batch waits until the queued motion finishes."""
+        states = iter([(0, 1)] * 3)
+        initialized_controller.arm.state = 2
+        initialized_controller.arm.get_state.side_effect = lambda: next(states, (0, 2))
+        initialized_controller.begin_batch()
+        assert initialized_controller.move_joints([0] * 6) is True
+        assert initialized_controller.end_batch(timeout=2) is True
+        assert initialized_controller.arm.get_state.call_count >= 4
+
+    def test_wait_until_idle_waits_for_queued_motion(self, initialized_controller):
+        """Test that a stale idle state does not end the wait before motion starts."""
+        start = time.time()
+
+        def get_state():
+            elapsed = time.time() - start
+            if elapsed < 0.1:
+                return (0, 2)  # Queued move has not started yet
+            if elapsed < 0.3:
+                return (0, 1)
+            return (0, 2)
+
+        initialized_controller.arm.state = 2
+        initialized_controller.arm.get_state.side_effect = get_state
+        assert initialized_controller.move_joints([0] * 6, wait=False) is True
+        assert initialized_controller.wait_until_idle(timeout=2, settle_ms=50) is True
+        assert time.time() - start >= 0.3
+
+    def test_wait_until_idle_without_motion(self, initialized_controller):
+        """Test that a queued move never seen moving must stay idle for the longer window."""
+        initialized_controller.arm.state = 2
+        initialized_controller.arm.get_state.return_value = (0, 2)
+        assert initialized_controller.move_joints([0] * 6, wait=False) is True
+        start = time.time()
+        assert initialized_controller.wait_until_idle(timeout=2, settle_ms=50) is True
+        assert time.time() - start >= 0.5
+
+    def test_wait_until_idle_after_blocking_move(self, initialized_controller):
+        """Test that only the settle delay applies after a blocking move."""
+        initialized_controller.arm.state = 2
+        initialized_controller.arm.get_state.return_value = (0, 2)
+        assert initialized_controller.move_joints([0] * 6) is True
+        start = time.time()
+        assert initialized_controller.wait_until_idle(timeout=2, settle_ms=50) is True
+        assert time.time() - start < 0.3
+
+    def test_state_callback_wakes_waiter(self, initialized_controller):
+        """Test that the state-changed callback signals waiting threads."""
+        initialized_controller._state_event.clear()
+        initialized_controller._state_changed_callback({'state': 2})
+        assert initialized_controller._state_event.is_set()
+
+    def test_batched_raises_on_failure(self, initialized_controller):
+        """Test that a failed batch is reported to the caller."""
+        initialized_controller.arm.get_state.return_value = (0, 2)
+        with pytest.raises(RuntimeError, match="did not complete"):
+            with initialized_controller.batched():
+                initialized_controller.arm.state = 4
+
+    def test_batch_closed_on_exception(self, initialized_controller):
+        """Test that an exception closes the batch without waiting."""
+        with pytest.raises(KeyboardInterrupt):
+            with initialized_controller.batched():
+                raise KeyboardInterrupt
+        assert initialized_controller._batch_active is False
+
+
 class TestUniversalGripperControl:
     """Test universal gripper control methods."""
     
@@ -343,6 +447,12 @@ class TestStateManagementAndMonitoring:
         initialized_controller._state_changed_callback({'state': 4})
         assert initialized_controller.is_alive is False
     
+    def test_has_error(self, initialized_controller):
+        """Test fault detection."""
+        assert initialized_controller.has_error() is False
+        initialized_controller._state_changed_callback({'state': 4})
+        assert initialized_controller.has_error() is True
+
     def test_get_error_history(self, initialized_controller):
         """Test retrieving error history."""
         initialized_controller._error_warn_callback({'error_code': 10})
@@ -383,6 +493,15 @@ class TestUtilityMethods:
         assert info['has_gripper'] is True
         assert info['has_track'] is True
     
+    def test_snapshot_capabilities(self, initialized_controller):
+        """Test taking a capability snapshot."""
+        initialized_controller.enable_track_component()
+        caps = initialized_controller.snapshot_capabilities()
+        assert isinstance(caps, Capabilities)
+        assert caps.track_enabled is True
+        assert caps.has_gripper is True
+        assert caps.positions == frozenset({'home', 'pickup'})
+
     def test_check_code_success(self, initialized_controller):
         """Test check_code for success."""
         assert initialized_controller.check_code(0, 'test_op') is True